@@ -1,22 +1,39 @@
+import csv
 import sys
+import heapq
+from bisect import bisect_right
 from collections import deque
-from typing import List, Tuple, Dict, Any
-from flask import Flask, request, jsonify
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from functools import lru_cache
+from operator import attrgetter
+from typing import List, Tuple, Dict, Any, Optional
+import orjson
+from flask import Flask, request
 from flask_cors import CORS
+from waitress import serve
 
 app = Flask(__name__)
 CORS(app)
 
+# Minimum number of processes before the CLI runs the algorithms in parallel
+PARALLEL_THRESHOLD = 1000
+
+by_arrival_time = attrgetter('arrival_time')
+
+@dataclass(slots=True, eq=False)
 class Process:
-    def __init__(self, process_id: str, arrival_time: int, burst_time: int, priority: int):
-        self.process_id = process_id
-        self.arrival_time = arrival_time
-        self.burst_time = burst_time
-        self.priority = priority
-        self.remaining_time = burst_time
-        self.finish_time = 0
-        self.turnaround_time = 0
-        self.waiting_time = 0
+    process_id: str
+    arrival_time: int
+    burst_time: int
+    priority: int
+    remaining_time: int = field(init=False)
+    finish_time: int = field(default=0, init=False)
+    turnaround_time: int = field(default=0, init=False)
+    waiting_time: int = field(default=0, init=False)
+    
+    def __post_init__(self):
+        self.remaining_time = self.burst_time
     
     def copy(self):
         """Create a copy of the process"""
@@ -36,11 +53,11 @@ class Process:
             'waiting_time': self.waiting_time
         }
 
+@dataclass(slots=True, eq=False)
 class GanttEntry:
-    def __init__(self, process_id: str, start_time: int, end_time: int):
-        self.process_id = process_id
-        self.start_time = start_time
-        self.end_time = end_time
+    process_id: str
+    start_time: int
+    end_time: int
     
     def to_dict(self):
         """Convert Gantt entry to dictionary"""
@@ -55,22 +72,14 @@ def read_processes(filename: str) -> List[Process]:
     processes = []
 
     try:
-        with open(filename, 'r') as file:
-            for line in file:
-                line = line.strip()
-                if not line:
-                    continue
-                
-                parts = line.split(',')
-                if len(parts) != 4:
+        with open(filename, 'r', newline='') as file:
+            for row in csv.reader(file):
+                # Blank lines come back as empty rows
+                if len(row) != 4:
                     continue
                 
-                process_id = parts[0].strip()
-                arrival_time = int(parts[1].strip())
-                burst_time = int(parts[2].strip())
-                priority = int(parts[3].strip())
-                
-                processes.append(Process(process_id, arrival_time, burst_time, priority))
+                process_id, arrival_time, burst_time, priority = row
+                processes.append(Process(process_id.strip(), int(arrival_time), int(burst_time), int(priority)))
         
         return processes
     
@@ -83,139 +92,165 @@ def read_processes(filename: str) -> List[Process]:
 
 def schedule_fcfs(processes: List[Process]) -> Dict[str, Any]:
     """First-Come, First-Served (FCFS) Scheduling"""
-    processes.sort(key=lambda p: p.arrival_time)
+    processes.sort(key=by_arrival_time)
     
     gantt = []
     current_time = 0
     total_idle_time = 0
     
     for process in processes:
-        if current_time < process.arrival_time:
-            gantt.append(GanttEntry("IDLE", current_time, process.arrival_time))
-            total_idle_time += (process.arrival_time - current_time)
-            current_time = process.arrival_time
+        arrival_time = process.arrival_time
+        burst_time = process.burst_time
+        
+        if current_time < arrival_time:
+            total_idle_time += (arrival_time - current_time)
+            current_time = arrival_time
         
-        gantt.append(GanttEntry(process.process_id, current_time, current_time + process.burst_time))
-        current_time += process.burst_time
+        gantt.append(GanttEntry(process.process_id, current_time, current_time + burst_time))
+        current_time += burst_time
         process.finish_time = current_time
-        process.turnaround_time = process.finish_time - process.arrival_time
-        process.waiting_time = process.turnaround_time - process.burst_time
+        process.turnaround_time = current_time - arrival_time
+        process.waiting_time = process.turnaround_time - burst_time
     
     return get_results_dict(processes, gantt, current_time, total_idle_time)
 
 def schedule_sjf(processes: List[Process]) -> Dict[str, Any]:
     """Shortest Job First (SJF) Scheduling - Non-preemptive"""
-    completed = []
+    arrivals = sorted(processes, key=by_arrival_time)
+    ready = []
     gantt = []
     current_time = 0
     total_idle_time = 0
+    completed = 0
+    next_index = 0
     
-    while len(completed) < len(processes):
-        available = [p for p in processes if p.arrival_time <= current_time and p not in completed]
+    while completed < len(processes):
+        while next_index < len(arrivals) and arrivals[next_index].arrival_time <= current_time:
+            p = arrivals[next_index]
+            heapq.heappush(ready, (p.burst_time, p.arrival_time, next_index, p))
+            next_index += 1
         
-        if not available:
-            next_arrival = min(p.arrival_time for p in processes if p not in completed)
-            gantt.append(GanttEntry("IDLE", current_time, next_arrival))
+        if not ready:
+            next_arrival = arrivals[next_index].arrival_time
             total_idle_time += (next_arrival - current_time)
             current_time = next_arrival
             continue
         
-        selected = min(available, key=lambda p: (p.burst_time, p.arrival_time))
+        _, arrival_time, _, selected = heapq.heappop(ready)
+        burst_time = selected.burst_time
         
-        gantt.append(GanttEntry(selected.process_id, current_time, current_time + selected.burst_time))
-        current_time += selected.burst_time
+        gantt.append(GanttEntry(selected.process_id, current_time, current_time + burst_time))
+        current_time += burst_time
         selected.finish_time = current_time
-        selected.turnaround_time = selected.finish_time - selected.arrival_time
-        selected.waiting_time = selected.turnaround_time - selected.burst_time
-        completed.append(selected)
+        selected.turnaround_time = current_time - arrival_time
+        selected.waiting_time = selected.turnaround_time - burst_time
+        completed += 1
     
     return get_results_dict(processes, gantt, current_time, total_idle_time)
 
 def schedule_rr(processes: List[Process], time_quantum: int) -> Dict[str, Any]:
     """Round Robin (RR) Scheduling - Preemptive"""
-    processes_copy = [p.copy() for p in processes]
-    processes_copy.sort(key=lambda p: p.arrival_time)
+    processes.sort(key=by_arrival_time)
+    
+    arrival_times = [p.arrival_time for p in processes]
     
     ready_queue = deque()
     gantt = []
     current_time = 0
     total_idle_time = 0
     completed = 0
-    process_index = 0
+    last_process = None
+    process_index = bisect_right(arrival_times, current_time)
+    ready_queue.extend(processes[:process_index])
     
-    if process_index < len(processes_copy) and processes_copy[process_index].arrival_time <= current_time:
-        ready_queue.append(processes_copy[process_index])
-        process_index += 1
-    
-    while completed < len(processes_copy):
+    while completed < len(processes):
         if not ready_queue:
-            next_arrival = processes_copy[process_index].arrival_time
-            gantt.append(GanttEntry("IDLE", current_time, next_arrival))
+            next_arrival = arrival_times[process_index]
             total_idle_time += (next_arrival - current_time)
             current_time = next_arrival
-            ready_queue.append(processes_copy[process_index])
-            process_index += 1
+            new_index = bisect_right(arrival_times, current_time, process_index)
+            ready_queue.extend(processes[process_index:new_index])
+            process_index = new_index
         
         current = ready_queue.popleft()
-        execute_time = min(time_quantum, current.remaining_time)
+        remaining_time = current.remaining_time
+        execute_time = min(time_quantum, remaining_time)
         
-        gantt.append(GanttEntry(current.process_id, current_time, current_time + execute_time))
+        # Extend the previous slice when the same process keeps the CPU
+        # (compared by identity, since process IDs are not guaranteed unique)
+        if last_process is current and gantt[-1].end_time == current_time:
+            gantt[-1].end_time += execute_time
+        else:
+            gantt.append(GanttEntry(current.process_id, current_time, current_time + execute_time))
+            last_process = current
         current_time += execute_time
-        current.remaining_time -= execute_time
+        current.remaining_time = remaining_time - execute_time
         
-        while process_index < len(processes_copy) and processes_copy[process_index].arrival_time <= current_time:
-            ready_queue.append(processes_copy[process_index])
-            process_index += 1
+        new_index = bisect_right(arrival_times, current_time, process_index)
+        ready_queue.extend(processes[process_index:new_index])
+        process_index = new_index
         
         if current.remaining_time > 0:
             ready_queue.append(current)
         else:
             current.finish_time = current_time
-            current.turnaround_time = current.finish_time - current.arrival_time
+            current.turnaround_time = current_time - current.arrival_time
             current.waiting_time = current.turnaround_time - current.burst_time
             completed += 1
     
-    return get_results_dict(processes_copy, gantt, current_time, total_idle_time)
+    return get_results_dict(processes, gantt, current_time, total_idle_time)
 
 def schedule_priority(processes: List[Process]) -> Dict[str, Any]:
     """Priority Scheduling - Non-preemptive (Lower number = Higher priority)"""
-    completed = []
+    arrivals = sorted(processes, key=by_arrival_time)
+    ready = []
     gantt = []
     current_time = 0
     total_idle_time = 0
+    completed = 0
+    next_index = 0
     
-    while len(completed) < len(processes):
-        available = [p for p in processes if p.arrival_time <= current_time and p not in completed]
+    while completed < len(processes):
+        while next_index < len(arrivals) and arrivals[next_index].arrival_time <= current_time:
+            p = arrivals[next_index]
+            heapq.heappush(ready, (p.priority, p.arrival_time, next_index, p))
+            next_index += 1
         
-        if not available:
-            next_arrival = min(p.arrival_time for p in processes if p not in completed)
-            gantt.append(GanttEntry("IDLE", current_time, next_arrival))
+        if not ready:
+            next_arrival = arrivals[next_index].arrival_time
             total_idle_time += (next_arrival - current_time)
             current_time = next_arrival
             continue
         
-        selected = min(available, key=lambda p: (p.priority, p.arrival_time))
+        _, arrival_time, _, selected = heapq.heappop(ready)
+        burst_time = selected.burst_time
         
-        gantt.append(GanttEntry(selected.process_id, current_time, current_time + selected.burst_time))
-        current_time += selected.burst_time
+        gantt.append(GanttEntry(selected.process_id, current_time, current_time + burst_time))
+        current_time += burst_time
         selected.finish_time = current_time
-        selected.turnaround_time = selected.finish_time - selected.arrival_time
-        selected.waiting_time = selected.turnaround_time - selected.burst_time
-        completed.append(selected)
+        selected.turnaround_time = current_time - arrival_time
+        selected.waiting_time = selected.turnaround_time - burst_time
+        completed += 1
     
     return get_results_dict(processes, gantt, current_time, total_idle_time)
 
 def get_results_dict(processes: List[Process], gantt: List[GanttEntry], total_time: int, total_idle_time: int) -> Dict[str, Any]:
     """Get scheduling results as dictionary"""
-    total_turnaround = sum(p.turnaround_time for p in processes)
-    total_waiting = sum(p.waiting_time for p in processes)
-    
+    process_dicts = []
+    total_turnaround = 0
+    total_waiting = 0
+
+    for p in processes:
+        process_dicts.append(p.to_dict())
+        total_turnaround += p.turnaround_time
+        total_waiting += p.waiting_time
+
     avg_turnaround = total_turnaround / len(processes) if processes else 0
     avg_waiting = total_waiting / len(processes) if processes else 0
     cpu_utilization = ((total_time - total_idle_time) / total_time) * 100 if total_time > 0 else 0
     
     return {
-        'processes': [p.to_dict() for p in processes],
+        'processes': process_dicts,
         'gantt': [g.to_dict() for g in gantt],
         'total_time': total_time,
         'total_idle_time': total_idle_time,
@@ -227,8 +262,13 @@ def get_results_dict(processes: List[Process], gantt: List[GanttEntry], total_ti
 def print_results(processes: List[Process], gantt: List[GanttEntry], total_time: int, total_idle_time: int):
     """Print scheduling results (for CLI use)"""
     print("Gantt Chart: ", end="")
+    last_end = 0
     for entry in gantt:
+        # Gaps between entries are idle CPU time
+        if entry.start_time > last_end:
+            print(f"[{last_end}]--IDLE--", end="")
         print(f"[{entry.start_time}]--{entry.process_id}--", end="")
+        last_end = entry.end_time
     print(f"[{total_time}]")
     
     print("\nProcess   | Finish Time | Turnaround Time | Waiting Time")
@@ -251,44 +291,67 @@ def print_results(processes: List[Process], gantt: List[GanttEntry], total_time:
     print(f"Average Waiting Time: {avg_waiting:.2f}")
     print(f"CPU Utilization: {cpu_utilization:.1f}%")
 
+@lru_cache(maxsize=256)
+def schedule_cached(algorithm: str, time_quantum: Optional[int], process_key: Tuple[Tuple[str, int, int, int], ...]) -> bytes:
+    """Run an algorithm on (id, arrival, burst, priority) tuples and return the encoded JSON result"""
+    processes = [Process(*p) for p in process_key]
+    
+    if algorithm == 'fcfs':
+        result = schedule_fcfs(processes)
+    elif algorithm == 'sjf':
+        result = schedule_sjf(processes)
+    elif algorithm == 'rr':
+        result = schedule_rr(processes, time_quantum)
+    else:
+        result = schedule_priority(processes)
+    
+    return orjson.dumps(result)
+
+def is_int(value: Any) -> bool:
+    """Check whether a decoded JSON value is an integer (booleans excluded)"""
+    return isinstance(value, int) and not isinstance(value, bool)
+
+def error_response(message: str, status: int):
+    """Build a JSON error response"""
+    return app.response_class(orjson.dumps({'error': message}), status=status, mimetype='application/json')
+
 @app.route('/api/schedule', methods=['POST'])
 def api_schedule():
     """API endpoint for scheduling"""
     try:
-        data = request.json
+        data = orjson.loads(request.get_data())
         processes_data = data.get('processes', [])
         algorithm = data.get('algorithm', 'fcfs')
         time_quantum = data.get('time_quantum', 3)
         
-        # Convert JSON data to Process objects
-        processes = []
-        for p_data in processes_data:
-            processes.append(Process(
-                process_id=p_data['id'],
-                arrival_time=p_data['arrival'],
-                burst_time=p_data['burst'],
-                priority=p_data['priority']
-            ))
+        # Input order is kept in the key since it decides tie-breaking and output order
+        process_key = tuple(
+            (str(p_data['id']), p_data['arrival'], p_data['burst'], p_data['priority'])
+            for p_data in processes_data
+        )
         
-        if not processes:
-            return jsonify({'error': 'No processes provided'}), 400
+        if not process_key:
+            return error_response('No processes provided', 400)
         
-        # Run selected algorithm
-        if algorithm == 'fcfs':
-            result = schedule_fcfs([p.copy() for p in processes])
-        elif algorithm == 'sjf':
-            result = schedule_sjf([p.copy() for p in processes])
-        elif algorithm == 'rr':
-            result = schedule_rr([p.copy() for p in processes], time_quantum)
-        elif algorithm == 'priority':
-            result = schedule_priority([p.copy() for p in processes])
-        else:
-            return jsonify({'error': 'Invalid algorithm'}), 400
+        if algorithm not in ('fcfs', 'sjf', 'rr', 'priority'):
+            return error_response('Invalid algorithm', 400)
+        
+        # The cache treats 1, 1.0 and True as the same key, so only exact integers are accepted
+        if not all(is_int(value) for p in process_key for value in p[1:]):
+            return error_response('Arrival, burst and priority must be integers', 400)
+        
+        if algorithm == 'rr' and not is_int(time_quantum):
+            return error_response('Time quantum must be an integer', 400)
+        
+        # Only Round Robin depends on the time quantum
+        if algorithm != 'rr':
+            time_quantum = None
         
-        return jsonify(result)
+        result = schedule_cached(algorithm, time_quantum, process_key)
+        return app.response_class(result, status=200, mimetype='application/json')
     
     except Exception as e:
-        return jsonify({'error': str(e)}), 500
+        return error_response(str(e), 500)
 
 @app.route('/favicon.ico')
 def favicon():
@@ -344,24 +407,30 @@ def main():
         print("No processes to schedule.")
         sys.exit(1)
     
-    result = schedule_fcfs([p.copy() for p in processes])
-    print_results_from_dict(result)
-    print("\n")
+    runs = [
+        (schedule_fcfs, ()),
+        (schedule_sjf, ()),
+        (schedule_rr, (time_quantum,)),
+        (schedule_priority, ()),
+    ]
     
-    result = schedule_sjf([p.copy() for p in processes])
-    print_results_from_dict(result)
-    print("\n")
-    
-    result = schedule_rr([p.copy() for p in processes], time_quantum)
-    print_results_from_dict(result)
-    print("\n")
-    
-    result = schedule_priority([p.copy() for p in processes])
-    print_results_from_dict(result)
+    if len(processes) < PARALLEL_THRESHOLD:
+        # Starting worker processes costs more than scheduling small inputs
+        results = [fn([p.copy() for p in processes], *args) for fn, args in runs]
+    else:
+        # Each worker gets its own unpickled copy of the processes
+        with ProcessPoolExecutor(max_workers=len(runs)) as executor:
+            futures = [executor.submit(fn, processes, *args) for fn, args in runs]
+            results = [future.result() for future in futures]
+    
+    for index, result in enumerate(results):
+        if index > 0:
+            print("\n")
+        print_results_from_dict(result)
 
 if __name__ == "__main__":
-    # Run as Flask app if no command line arguments, otherwise run CLI
+    # Run as web server if no command line arguments, otherwise run CLI
     if len(sys.argv) > 1 and sys.argv[1] != 'run':
         main()
     else:
-        app.run(debug=True, port=5000)
\ No newline at end of file
+        serve(app, host='127.0.0.1', port=5000, threads=8)